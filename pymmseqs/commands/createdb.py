@@ -1,7 +1,7 @@
 # pymmseqs/commands/createdb.py
 
 from pathlib import Path
-from typing import Union, List
+from typing import Union, List, Optional
 
 from ..config import CreateDBConfig
 from ..parsers import CreateDBParser
@@ -13,8 +13,9 @@ def createdb(
     # Optional parameters
     shuffle: bool = True,
     compressed: bool = False,
-    createdb_mode: int = 0,
+    createdb_mode: Optional[int] = None,
     dbtype: int = 0,
+    cache_dir: Union[str, Path, None] = None,
 
 ) -> CreateDBParser:
     """
@@ -43,8 +44,12 @@ def createdb(
     
     `createdb_mode` : int, optional
         Database creation mode
-        - 0: Copy data (default)
+        - None: Soft-link if the inputs allow it, otherwise copy (default)
+        - 0: Copy data
         - 1: Soft-link data and write a new index (only works with single-line FASTA/Q)
+
+        A soft-linked database reads its sequences from `fasta_file`, so it stops working
+        if the FASTA files are later moved or deleted. Pass 0 to always copy
     
     `dbtype` : int, optional
         Database type
@@ -52,6 +57,11 @@ def createdb(
         - 1: Amino acid sequences
         - 2: Nucleotide sequences
     
+    `cache_dir` : Union[str, Path, None], optional
+        Directory for reusing previously created databases
+        - None: Always run mmseqs2 (default)
+        - If set, running again with identical FASTA content and options copies the cached database instead of running mmseqs2
+    
     Returns
     -------
     CreateDBParser object
@@ -65,6 +75,7 @@ def createdb(
         compressed=compressed,
         createdb_mode=createdb_mode,
         dbtype=dbtype,
+        cache_dir=cache_dir,
     )
 
     config.run()
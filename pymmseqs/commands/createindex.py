@@ -1,7 +1,7 @@
 # pymmseqs/commands/createindex.py
 
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from ..config import CreateIndexConfig
 from ..parsers import CreateIndexParser
@@ -14,7 +14,7 @@ def createindex(
     s: float = 7.5,
     k: int = 0,
     v: int = 3,
-    threads: int = 14,
+    threads: Optional[int] = None,
     compressed: bool = False,
     create_lookup: int = 0,
     
@@ -50,7 +50,7 @@ def createindex(
         
     `threads` : int, optional
         Number of threads to use.
-        - Default: 14
+        - Default: all CPUs available to the process
         
     `compressed` : bool, optional
         Use compressed database.
@@ -1,7 +1,7 @@
 # pymmseqs/commands/search.py
 
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from ..config import SearchConfig
 from ..parsers import SearchParser
@@ -22,7 +22,7 @@ def search(
     cov_mode: int = 0,
     a: bool = False,
     max_seqs: int = 300,
-    threads: int = 14,
+    threads: Optional[int] = None,
     compressed: bool = False,
 
 ) -> SearchParser:
@@ -85,7 +85,7 @@ def search(
     
     `threads` : int, optional
         CPU threads
-        - 14 (default)
+        - All CPUs available to the process (default)
     
     `compressed` : bool, optional
             Compress output
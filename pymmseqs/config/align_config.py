@@ -1,13 +1,13 @@
 # pymmseqs/config/align_config.py
 
 from pathlib import Path
-from typing import Union
+from typing import Union, Optional
 
 from .base import BaseConfig
 from ..defaults import loader
 from ..utils import (
     get_caller_dir,
-    run_mmseqs_command
+    get_available_cpus
 )
 
 DEFAULTS = loader.load("align")
@@ -55,7 +55,7 @@ class AlignConfig(BaseConfig):
         sub_mat: str = "aa:blosum62.out,nucl:nucleotide.out",
         max_seq_len: int = 65535,
         db_load_mode: int = 0,
-        threads: int = 14,
+        threads: Optional[int] = None,
         compressed: int = 0,
         v: int = 3,
     ):
@@ -228,7 +228,7 @@ class AlignConfig(BaseConfig):
 
         `threads` : int, optional
             Number of CPU-cores used
-            - 14 (default)
+            - All CPUs available to the process (default)
 
         `compressed` : int, optional
             Write compressed output
@@ -295,7 +295,7 @@ class AlignConfig(BaseConfig):
         self.sub_mat = sub_mat
         self.max_seq_len = max_seq_len
         self.db_load_mode = db_load_mode
-        self.threads = threads
+        self.threads = get_available_cpus() if threads is None else threads
         self.compressed = compressed
         self.v = v
         
@@ -322,10 +322,10 @@ class AlignConfig(BaseConfig):
     def run(self) -> None:
         self._resolve_all_path(self._caller_dir)
         
-        self._validate()
+        self._validate_if_dirty()
         
         args = self._get_command_args("align")
-        mmseqs_output = run_mmseqs_command(args)
+        mmseqs_output = self._run_command(args)
         
         self._handle_command_output(
             mmseqs_output=mmseqs_output,
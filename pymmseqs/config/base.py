@@ -1,32 +1,234 @@
 # pymmseqs/config/base.py
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
 from datetime import datetime
 from pathlib import Path
 import yaml
+import glob
 import os
+import sys
 
 from ..utils import (
     resolve_path,
     get_caller_dir,
-    add_arg
+    add_arg,
+    get_available_cpus,
+    run_mmseqs_command
 )
 
+class _CompiledDefaults(NamedTuple):
+    """
+    Per-command data derived once from a `_defaults` dictionary.
+
+    The YAML defaults are shared by every instance of a config class, so the
+    per-parameter dispatch done while building arguments only has to happen once.
+    """
+    defaults: dict
+    positional_params: List[str]
+    option_builders: List[Tuple[str, Any, Callable[[list, Any], None]]]
+    file_params: List[str]
+    # (name, required, default, choices, choices as a frozenset for hashed lookups)
+    choice_params: List[Tuple[str, bool, Any, list, frozenset]]
+
+# Marker for attributes that have not been set yet
+_UNSET = object()
+
+# Directories holding more inputs than this are listed once instead of stat-ing each file
+_BULK_EXISTS_THRESHOLD = 4
+
+def _bulk_exists(paths: List[str]) -> Set[str]:
+    """
+    Find which of `paths` exist, listing each directory once instead of calling stat per file.
+    
+    Only directories containing more than `_BULK_EXISTS_THRESHOLD` of the paths are listed.
+    Symbolic links are not reported since their target may be missing, so paths that are
+    not returned still need a regular check.
+    
+    Args:
+        paths (List[str]): Paths to look up
+        
+    Returns:
+        Set[str]: The subset of `paths` found as regular directory entries
+    """
+    paths_by_dir: Dict[str, List[str]] = {}
+    for path in paths:
+        paths_by_dir.setdefault(os.path.dirname(path), []).append(path)
+
+    found = set()
+    for directory, dir_paths in paths_by_dir.items():
+        if len(dir_paths) <= _BULK_EXISTS_THRESHOLD:
+            continue
+        try:
+            with os.scandir(directory or ".") as entries:
+                names = {entry.name for entry in entries if not entry.is_symlink()}
+        except OSError:
+            continue
+        found.update(path for path in dir_paths if os.path.basename(path) in names)
+    return found
+
+def _stream_name(target: Union[str, Path, IO]) -> str:
+    """
+    Describe an output stream target for logs and error messages.
+    """
+    if isinstance(target, (str, Path)):
+        return str(target)
+    return getattr(target, 'name', repr(target))
+
+def _make_arg_builder(param_name: str, param_info: dict) -> Callable[[list, Any], None]:
+    """
+    Create a function that appends the command-line arguments of an optional parameter.
+
+    The parameter type is resolved here, so the returned function only compares the
+    current value against the default and formats it.
+    
+    Args:
+        param_name (str): Name of the parameter as defined in the YAML defaults
+        param_info (dict): YAML definition of the parameter
+        
+    Returns:
+        Callable[[list, Any], None]: Function taking the argument list and the current value
+    """
+    default_value = param_info['default']
+    
+    # Create parameter flag (handle single character parameters differently)
+    cmd_param = sys.intern(f"-{param_name}" if len(param_name) == 1 else f"--{param_name.replace('_', '-')}")
+
+    if param_info['twin']:
+        # For twin parameters, compare as strings
+        default_str = str(default_value)
+
+        def build_twin(args, value):
+            if str(value) != default_str:
+                add_arg(args, cmd_param, value, default_value)
+        return build_twin
+
+    if param_info['type'] == "comma_separated_str":
+        # For comma-separated strings, compare as lists
+        default_list = [item.strip() for item in str(default_value).split(",")]
+
+        def build_comma_separated(args, value):
+            current_list = [item.strip() for item in str(value).split(",")]
+            if current_list != default_list:
+                args.extend((cmd_param, ",".join(current_list)))
+        return build_comma_separated
+
+    # For booleans and all other types, only add if different from default
+    def build_option(args, value):
+        add_arg(args, cmd_param, value, default_value)
+    return build_option
+
+def _compile_defaults(defaults: dict) -> _CompiledDefaults:
+    """
+    Build the compiled form of a `_defaults` dictionary.
+    """
+    return _CompiledDefaults(
+        defaults=defaults,
+        positional_params=[
+            param_name for param_name, param_info in defaults.items()
+            if param_info['required']
+        ],
+        option_builders=[
+            (param_name, param_info['default'], _make_arg_builder(param_name, param_info))
+            for param_name, param_info in defaults.items()
+            if not param_info['required']
+        ],
+        file_params=[
+            param_name for param_name, param_info in defaults.items()
+            if param_info['required'] and param_info['should_exist']
+        ],
+        choice_params=[
+            (
+                param_name, param_info['required'], param_info['default'],
+                param_info['choices'], frozenset(param_info['choices'])
+            )
+            for param_name, param_info in defaults.items()
+            if param_info['choices'] is not None
+        ],
+    )
+
 class BaseConfig(ABC):
 
+    # Callable executing the mmseqs2 arguments, can be replaced per instance (e.g. in tests)
+    _runner = staticmethod(run_mmseqs_command)
+
+    # Existence test for required input files, can be replaced per instance (e.g. in tests)
+    _path_exists = staticmethod(os.path.exists)
+
+    # Compiled form of _defaults, see _compiled_defaults()
+    _compiled: Optional[_CompiledDefaults] = None
+
     def __init__(self, **kwargs):
+        self._dirty = True
         self._has_log = True
         self._write_on_terminal = False
+        self._stdout = None
+        self._stderr = None
         self._defaults = {}
 
         for key, value in kwargs.items():
             setattr(self, key, value)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Changing a public parameter invalidates the last successful validation
+        if not name.startswith('_') and getattr(self, name, _UNSET) != value:
+            object.__setattr__(self, '_dirty', True)
+        object.__setattr__(self, name, value)
+
+    def set_parameters(self, **kwargs) -> None:
+        """
+        Set several MMseqs2 parameters at once.
+        
+        Args:
+            **kwargs: Parameter names, as used in the configuration, and their new values
+            
+        Raises:
+            ValueError: If a name is not a parameter of this configuration
+        """
+        defaults = self._defaults
+        for param_name, value in kwargs.items():
+            if defaults.get(param_name) is None:
+                raise ValueError(f"Unknown parameter: {param_name}")
+            setattr(self, param_name, value)
+
     def _set_config_options(self, has_log, write_on_terminal):
         self._has_log = has_log
         self._write_on_terminal = write_on_terminal
 
+    def stream_output(
+        self,
+        stdout: Union[str, Path, IO, None] = None,
+        stderr: Union[str, Path, IO, None] = None
+    ) -> None:
+        """
+        Write the mmseqs2 output of `run()` to files instead of keeping it in memory.
+        
+        Streamed output is not repeated on the terminal or in the execution log, which
+        only records where it was written. Calling it without arguments captures the
+        output again.
+        
+        Args:
+            stdout (Union[str, Path, IO, None]): File path or open file object for stdout
+            stderr (Union[str, Path, IO, None]): File path or open file object for stderr
+        """
+        self._stdout = stdout
+        self._stderr = stderr
+
+    def _run_command(self, args: list):
+        """
+        Execute `args` with `_runner`, passing the streams set with `stream_output()`.
+        
+        Args:
+            args (list): Command arguments from `_get_command_args`
+            
+        Returns:
+            subprocess.CompletedProcess: The mmseqs2 result
+        """
+        if self._stdout is None and self._stderr is None:
+            return self._runner(args)
+        return self._runner(args, stdout=self._stdout, stderr=self._stderr)
+
     @abstractmethod
     def _validate(self):
         """
@@ -40,6 +242,43 @@ class BaseConfig(ABC):
         """
         pass
 
+    def _compiled_defaults(self) -> _CompiledDefaults:
+        """
+        Return the compiled form of `_defaults`, building it on first use.
+
+        Every instance of a config class shares the same loaded defaults, so the compiled
+        form is stored on the class. An instance holding another dictionary, such as
+        a deep copy, keeps its own compiled form instead.
+        
+        Returns:
+            _CompiledDefaults: Parameter lists and argument builders for `_defaults`
+        """
+        compiled = self._compiled
+        if compiled is None or compiled.defaults is not self._defaults:
+            compiled = _compile_defaults(self._defaults)
+            if '_compiled' in type(self).__dict__:
+                self._compiled = compiled
+            else:
+                type(self)._compiled = compiled
+        return compiled
+
+    def _validate_if_dirty(self, **kwargs: Any) -> None:
+        """
+        Run `_validate()` only if a parameter changed since the last successful validation.
+
+        Parameters are tracked on assignment, so in-place changes such as appending
+        to a list of paths are not detected.
+        
+        Args:
+            **kwargs: Passed on to `_validate()`
+        
+        Raises:
+            ValueError: If any parameter fails validation
+        """
+        if self._dirty:
+            self._validate(**kwargs)
+            self._dirty = False
+
     def to_dict(self, exclude_private: bool = True) -> Dict[str, Any]:
         """
         Convert configuration to a dictionary, excluding None values.
@@ -55,6 +294,43 @@ class BaseConfig(ABC):
                     if v is not None and (not exclude_private or not k.startswith('_'))}
         return base_dict
 
+    @staticmethod
+    def run_many(
+        configs: Iterable['BaseConfig'],
+        max_parallel: Optional[int] = None
+    ) -> None:
+        """
+        Run several independent configurations concurrently.
+        
+        Each configuration's `run()` is executed in a worker thread, so up to
+        `max_parallel` mmseqs2 processes run at the same time. By default, only as many
+        run at once as fit on the available CPUs given the largest `threads` among the
+        configurations. With the default `threads` (all CPUs) they therefore run one
+        after another, and lowering `threads` lets more of them run concurrently.
+        
+        Args:
+            configs (Iterable[BaseConfig]): Configurations to run
+            max_parallel (Optional[int]): Maximum number of commands running at once.
+                                          Defaults to the available CPUs divided by the
+                                          largest `threads` (1 for configurations
+                                          without it)
+            
+        Raises:
+            Exception: The first error raised by any configuration, after all have finished
+        """
+        configs = list(configs)
+        if max_parallel is None:
+            threads_per_run = max((getattr(config, 'threads', 1) or 1 for config in configs), default=1)
+            max_parallel = max(1, get_available_cpus() // threads_per_run)
+
+        with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+            futures = [executor.submit(config.run) for config in configs]
+
+        for future in futures:
+            error = future.exception()
+            if error is not None:
+                raise error
+
     @classmethod
     def from_yaml(cls, yaml_path: Union[str, Path]) -> 'BaseConfig':
         """
@@ -71,7 +347,7 @@ class BaseConfig(ABC):
             FileNotFoundError: If the YAML file or any required input files don't exist
         """
         caller_dir = Path(get_caller_dir())
-        yaml_path = resolve_path(yaml_path, caller_dir)
+        yaml_path = resolve_path(yaml_path, caller_dir, create_parent=False)
         
         with open(yaml_path, 'r') as f:
             config_dict = yaml.safe_load(f)
@@ -93,11 +369,14 @@ class BaseConfig(ABC):
             if param_info['type'] == 'path':
                 value = getattr(self, param_name)
                 if value:
+                    # Existing inputs already have a parent directory, only outputs
+                    # may need one created
+                    create_parent = not param_info['should_exist']
                     if isinstance(value, list):
-                        resolved_values = [str(resolve_path(v, base_dir)) for v in value]
+                        resolved_values = [str(resolve_path(v, base_dir, create_parent)) for v in value]
                         setattr(self, param_name, resolved_values)
                     else:
-                        resolved = str(resolve_path(value, base_dir))
+                        resolved = str(resolve_path(value, base_dir, create_parent))
                         setattr(self, param_name, resolved)
 
     def _check_required_files(self) -> None:
@@ -111,17 +390,19 @@ class BaseConfig(ABC):
             ValueError: If a required file parameter is not set
             FileNotFoundError: If any required file doesn't exist
         """
-        for param_name, param_info in self._defaults.items():
-            if param_info['required'] and param_info['should_exist']:
-                value = getattr(self, param_name)
-                if value is None:
-                    raise ValueError(f"Required file is not set: {param_name}")
+        for param_name in self._compiled_defaults().file_params:
+            value = getattr(self, param_name)
+            if value is None:
+                raise ValueError(f"Required file is not set: {param_name}")
 
-                if isinstance(value, list):
-                    for path in value:
+            if isinstance(value, list):
+                paths = [str(path) for path in value]
+                found = _bulk_exists(paths)
+                for path in paths:
+                    if path not in found:
                         self._check_file_exists(path)
-                else:
-                    self._check_file_exists(value)
+            else:
+                self._check_file_exists(value)
 
     def _check_file_exists(self, path: str) -> None:
         """
@@ -135,24 +416,20 @@ class BaseConfig(ABC):
         Raises:
             FileNotFoundError: If the file or any files with the prefix don't exist
         """
-        path_obj = Path(path)
-        
+        path = str(path)
+
         # If the exact file exists, we're good
-        if path_obj.exists():
+        if self._path_exists(path):
             return
         
         # Check if this might be an MMseqs2 database prefix
         # Look for files with extensions like .0, .1, .2, etc.
-        parent_dir = path_obj.parent
-        prefix = path_obj.name
-        
-        # Check if any files with this prefix exist in the directory
-        matching_files = list(parent_dir.glob(f"{prefix}.*"))
+        matching_file = next(glob.iglob(f"{glob.escape(path)}.*"), None)
         
-        if not matching_files:
+        if matching_file is None:
             raise FileNotFoundError(f"Required file not found: {path}")
 
-    def _validate_choices(self):
+    def _validate_choices(self, **overrides: Any):
         """
         Validate parameters against their allowed choices.
         
@@ -160,24 +437,31 @@ class BaseConfig(ABC):
         they contain valid values. Skips optional parameters that are set to
         their default values.
         
+        Args:
+            **overrides: Values checked instead of the attributes of the same name
+        
         Raises:
             ValueError: If any parameter has an invalid value
         """
-        for param_name, param_info in self._defaults.items():
-            value = getattr(self, param_name)
+        for param_name, required, default_value, choices, choice_set in self._compiled_defaults().choice_params:
+            value = overrides[param_name] if param_name in overrides else getattr(self, param_name)
             
             # Skip optional parameters with default values
-            if not param_info['required'] and value == param_info['default']:
+            if not required and value == default_value:
                 continue
             
-            # Validate choices if they exist
-            if param_info['choices'] is not None:
-                if value not in param_info['choices']:
-                    raise ValueError(
-                        f"{param_name} is {value} but must be one of {param_info['choices']}"
-                    )
-
-    def _get_command_args(self, command_name: str) -> list:
+            try:
+                valid = value in choice_set
+            except TypeError:
+                # Unhashable values can only be compared against the list
+                valid = value in choices
+
+            if not valid:
+                raise ValueError(
+                    f"{param_name} is {value} but must be one of {choices}"
+                )
+
+    def _get_command_args(self, command_name: str, **overrides: Any) -> list:
         """
         Generate command-line arguments for MMseqs2 execution.
         
@@ -189,6 +473,7 @@ class BaseConfig(ABC):
         
         Args:
             command_name (str): Name of the MMseqs2 command to execute
+            **overrides: Values used instead of the attributes of the same name
             
         Returns:
             list: Command arguments starting with command name followed by parameters
@@ -196,46 +481,22 @@ class BaseConfig(ABC):
         # Create the command arguments starting with the command name from YAML
         args = [command_name.replace('_', '-')]
         
-        # Loop through all parameters and add the arguments
-        for param_name, param_info in self._defaults.items():
-            if param_info['required']:
-                value = getattr(self, param_name)
-                if isinstance(value, list):
-                    for file_path in value:
-                        args.append(str(file_path))
-                else:
-                    args.append(str(value))
+        compiled = self._compiled_defaults()
+
+        # Required parameters are positional and always come first
+        for param_name in compiled.positional_params:
+            value = overrides[param_name] if param_name in overrides else getattr(self, param_name)
+            if isinstance(value, list):
+                args.extend(map(str, value))
             else:
-                # Get current and default values
-                current_value = getattr(self, param_name)
-                default_value = param_info['default']
-                
-                # Create parameter flag (handle single character parameters differently)
-                cmd_param = f"-{param_name}" if len(param_name) == 1 else f"--{param_name.replace('_', '-')}"
-                
-                # Handle different parameter types
-                if param_info['twin']:
-                    # For twin parameters, compare as strings
-                    if str(current_value) != str(default_value):
-                        add_arg(args, cmd_param, current_value, default_value)
-                        
-                elif param_info['type'] == "comma_separated_str":
-                    # For comma-separated strings, compare as lists
-                    current_list = [item.strip() for item in str(current_value).split(",")]
-                    default_list = [item.strip() for item in str(default_value).split(",")]
-                    if current_list != default_list:
-                        cleaned_value = ",".join(current_list)
-                        args.extend([cmd_param, cleaned_value])
-                            
-                elif isinstance(current_value, bool):
-                    # For boolean values, only add if different from default
-                    if current_value != default_value:
-                        args.extend([cmd_param, "1" if current_value else "0"])
-                        
-                else:
-                    # For all other types, compare directly
-                    if current_value != default_value:
-                        args.extend([cmd_param, str(current_value)])
+                args.append(str(value))
+        
+        # Optional parameters are only added when they differ from their default
+        for param_name, default_value, build_arg in compiled.option_builders:
+            value = overrides[param_name] if param_name in overrides else getattr(self, param_name)
+            if value == default_value:
+                continue
+            build_arg(args, value)
         
         return args
 
@@ -287,11 +548,15 @@ class BaseConfig(ABC):
                     f.write("STDOUT:\n")
                     f.write(mmseqs_output.stdout)
                     f.write("\n\n")
+                elif self._stdout is not None:
+                    f.write(f"STDOUT: written to {_stream_name(self._stdout)}\n\n")
                 
                 if mmseqs_output.stderr:
                     f.write("STDERR:\n")
                     f.write(mmseqs_output.stderr)
                     f.write("\n\n")
+                elif self._stderr is not None:
+                    f.write(f"STDERR: written to {_stream_name(self._stderr)}\n\n")
                 
                 f.write(f"Return code: {mmseqs_output.returncode}\n")
                 f.write(f"Status: {'Success' if success else 'Failed'}\n")
@@ -318,5 +583,7 @@ class BaseConfig(ABC):
                     error_summary = mmseqs_output.stderr.strip()
                 
                 error_message += f" Error: {error_summary}"
+            elif self._stderr is not None:
+                error_message += f" See {_stream_name(self._stderr)} for the error output."
             
             raise RuntimeError(error_message)
@@ -1,11 +1,11 @@
 from pathlib import Path
-from typing import Union
+from typing import Union, Optional
 
 from .base import BaseConfig
 from ..defaults import loader
 from ..utils import (
     get_caller_dir,
-    run_mmseqs_command
+    get_available_cpus
 )
 
 DEFAULTS = loader.load("convertalis")
@@ -39,7 +39,7 @@ class ConvertAlisConfig(BaseConfig):
         # Common parameters
         sub_mat: str = "aa:blosum62.out,nucl:nucleotide.out",
         db_load_mode: int = 0,
-        threads: int = 14,
+        threads: Optional[int] = None,
         compressed: bool = False,
         v: int = 3,
 
@@ -154,7 +154,7 @@ class ConvertAlisConfig(BaseConfig):
             
         `threads` : int, optional
             Number of CPU-cores used
-            - 14 (default)
+            - All CPUs available to the process (default)
             
         `compressed` : bool, optional
             Write compressed output
@@ -221,7 +221,7 @@ class ConvertAlisConfig(BaseConfig):
         # Common parameters
         self.sub_mat = sub_mat
         self.db_load_mode = db_load_mode
-        self.threads = threads
+        self.threads = get_available_cpus() if threads is None else threads
         self.compressed = compressed
         self.v = v
         
@@ -244,10 +244,10 @@ class ConvertAlisConfig(BaseConfig):
     def run(self) -> None:
         self._resolve_all_path(self._caller_dir)
         
-        self._validate()
+        self._validate_if_dirty()
         
         args = self._get_command_args("convertalis")
-        mmseqs_output = run_mmseqs_command(args)
+        mmseqs_output = self._run_command(args)
         
         self._handle_command_output(
             mmseqs_output=mmseqs_output,
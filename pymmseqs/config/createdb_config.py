@@ -1,17 +1,46 @@
 # pymmseqs/config/createdb_config.py
 
 from pathlib import Path
-from typing import Union, List
+from typing import Union, List, Optional, Dict
+import glob
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
 
 from .base import BaseConfig
 from ..defaults import loader   
 from ..utils import (
     get_caller_dir,
-    run_mmseqs_command
+    resolve_path,
+    file_sha256
 )
 
 DEFAULTS = loader.load("createdb")
 
+# Input extensions considered for soft-linking, compressed FASTA is always copied
+_SOFT_LINK_SUFFIXES = (".fasta", ".fa", ".fna", ".faa")
+
+# Files mmseqs2 createdb may write next to the database prefix
+_DB_SUFFIXES = ("", ".dbtype", ".index", ".lookup", ".source", "_h", "_h.dbtype", "_h.index")
+
+def _is_single_line_fasta(fasta_file: str) -> bool:
+    """
+    Check that every FASTA record stores its sequence on a single line.
+    """
+    with open(fasta_file, 'rb') as f:
+        previous_is_sequence = False
+        for line in f:
+            if line.startswith(b">"):
+                previous_is_sequence = False
+            elif not line.strip() or previous_is_sequence:
+                return False
+            else:
+                previous_is_sequence = True
+    return True
+
 class CreateDBConfig(BaseConfig):
     """
     Create a MMseqs2 database from a FASTA file and save it to the specified path prefix
@@ -48,9 +77,15 @@ class CreateDBConfig(BaseConfig):
 
     `createdb_mode` : int, optional
         Database creation mode
-        - 0: Copy data (default)
+        - None: Soft-link if the inputs allow it, otherwise copy (default)
+        - 0: Copy data
         - 1: Soft-link data and write a new index (only works with single-line FASTA/Q)
 
+        With None, soft-linking is used when `shuffle` and `compressed` are False and all
+        inputs are uncompressed single-line FASTA files on the same filesystem as `sequence_db`.
+        A soft-linked database reads its sequences from the FASTA files, so it stops working
+        if they are later moved or deleted. Pass 0 to always copy
+
     `id_offset` : int, optional
         Numeric ID offset in the index file
         - 0 (default)
@@ -71,6 +106,13 @@ class CreateDBConfig(BaseConfig):
         Create a `.lookup` file mapping internal IDs to FASTA IDs
         - True (default)
         - False
+
+    `cache_dir` : Union[str, Path, None], optional
+        Directory for reusing previously created databases
+        - None: Always run mmseqs2 (default)
+        - If set, the database files are cached under a key built from the content of
+          the FASTA files and the options. Running with the same inputs again copies the
+          cached files to `sequence_db` instead of running mmseqs2
     """
 
     def __init__(
@@ -79,11 +121,12 @@ class CreateDBConfig(BaseConfig):
         sequence_db: Union[str, Path],
         dbtype: int = 0,
         shuffle: bool = True,
-        createdb_mode: int = 0,
+        createdb_mode: Optional[int] = None,
         id_offset: int = 0,
         compressed: bool = False,
         v: int = 3,
-        write_lookup: bool = True
+        write_lookup: bool = True,
+        cache_dir: Union[str, Path, None] = None
     ):
         super().__init__()
         
@@ -101,24 +144,155 @@ class CreateDBConfig(BaseConfig):
         self._defaults = DEFAULTS
         self._path_params = [param for param, info in DEFAULTS.items() if info['type'] == 'path']
         self._caller_dir = get_caller_dir()
+        self._cache_dir = cache_dir
 
-    def _validate(self) -> None:
+    def _validate(self, createdb_mode: Optional[int] = None) -> None:
         self._check_required_files()
-        self._validate_choices()
+        if createdb_mode is None:
+            createdb_mode = self._effective_createdb_mode()
+        self._validate_choices(createdb_mode=createdb_mode)
             
         if self.id_offset < 0:
             raise ValueError(f"id_offset is {self.id_offset} but must be non-negative")
 
     def run(self) -> None:
         self._resolve_all_path(self._caller_dir)
-
-        self._validate()
+        # Choosing the automatic mode reads every input, so it is only done once per run
+        createdb_mode = self._effective_createdb_mode()
+        self._validate_if_dirty(createdb_mode=createdb_mode)
         
-        args = self._get_command_args("createdb")
-        mmseqs_output = run_mmseqs_command(args)
+        args = self._get_command_args("createdb", createdb_mode=createdb_mode)
+        if self._cache_dir is None:
+            mmseqs_output = self._run_command(args)
+        else:
+            mmseqs_output = self._run_cached(args)
         
         self._handle_command_output(
             mmseqs_output=mmseqs_output,
             output_identifier="Database creation",
             output_path=str(self.sequence_db)
         )
+
+    def _get_command_args(self, command_name: str, **overrides) -> list:
+        if "createdb_mode" not in overrides:
+            overrides["createdb_mode"] = self._effective_createdb_mode()
+        return super()._get_command_args(command_name, **overrides)
+
+    def _effective_createdb_mode(self) -> int:
+        """
+        Return `createdb_mode`, or the automatically chosen mode when it is None.
+
+        The automatic choice is not stored, so it follows later changes to the inputs
+        and options.
+        """
+        if self.createdb_mode is None:
+            return self._resolve_createdb_mode()
+        return self.createdb_mode
+
+    def _resolve_createdb_mode(self) -> int:
+        """
+        Choose the database creation mode when `createdb_mode` is None.
+
+        Soft-linking (mode 1) avoids copying the sequence data. mmseqs2 only supports it
+        for single-line FASTA without shuffling or compressed output. The database keeps
+        pointing at the input files, so they also have to be on the same filesystem.
+        
+        Returns:
+            int: 1 if all inputs can be soft-linked, otherwise 0
+        """
+        if self.shuffle or self.compressed:
+            return 0
+
+        try:
+            db_device = os.stat(os.path.dirname(os.path.abspath(self.sequence_db))).st_dev
+        except OSError:
+            # The output directory is only created when the paths are resolved
+            return 0
+        for fasta_file in map(str, self.fasta_file):
+            if not fasta_file.lower().endswith(_SOFT_LINK_SUFFIXES) or not os.path.isfile(fasta_file):
+                return 0
+            if os.stat(fasta_file).st_dev != db_device or not _is_single_line_fasta(fasta_file):
+                return 0
+        return 1
+
+    def _prefix_file_stats(self) -> Dict[str, tuple]:
+        """
+        Map the files starting with the `sequence_db` prefix to their inode, size and
+        modification time, so files written by a run can be told apart from leftovers.
+        """
+        prefix = glob.escape(str(self.sequence_db))
+        patterns = [prefix, f"{prefix}.*", f"{prefix}_h", f"{prefix}_h.*"]
+        stats = {}
+        for pattern in patterns:
+            for path in glob.glob(pattern):
+                stat = os.lstat(path)
+                stats[path] = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        return stats
+
+    def _remove_database_files(self) -> None:
+        """
+        Delete the database files of an earlier run at the `sequence_db` prefix.
+        """
+        inputs = set(map(str, self.fasta_file))
+        for suffix in _DB_SUFFIXES:
+            path = f"{self.sequence_db}{suffix}"
+            if path not in inputs and os.path.lexists(path):
+                os.remove(path)
+
+    def _run_cached(self, args: list) -> subprocess.CompletedProcess:
+        """
+        Restore the database from the cache, or run mmseqs2 and add its output to the cache.
+        
+        Args:
+            args (list): Command arguments from `_get_command_args`
+            
+        Returns:
+            subprocess.CompletedProcess: The mmseqs2 result, or a successful result
+                                         describing the cache hit
+        """
+        cache_dir = resolve_path(self._cache_dir, self._caller_dir)
+        cache_dir.mkdir(exist_ok=True)
+
+        # The FASTA names end up in the .source file, the options in everything else
+        key = hashlib.sha256(json.dumps({
+            "files": [[os.path.basename(f), file_sha256(f)] for f in self.fasta_file],
+            "args": args[len(self.fasta_file) + 2:],
+        }).encode()).hexdigest()
+        entry = cache_dir / key
+        
+        # Cached files keep the suffix mmseqs2 added to the database prefix
+        db_dir, db_name = os.path.split(str(self.sequence_db))
+        if entry.is_dir():
+            # Files of an earlier database would otherwise be mixed with the cached one
+            self._remove_database_files()
+            for cached_file in os.listdir(entry):
+                suffix = cached_file[len("db"):]
+                shutil.copy2(entry / cached_file, os.path.join(db_dir, db_name + suffix))
+            return subprocess.CompletedProcess(
+                args=args,
+                returncode=0,
+                stdout=f"(cache hit) Database copied from {entry}\n",
+                stderr=""
+            )
+
+        previous_files = self._prefix_file_stats()
+        mmseqs_output = self._run_command(args)
+        if mmseqs_output.returncode == 0:
+            # Only files this run created or rewrote belong to the entry, leftovers of
+            # earlier runs and inputs sharing the prefix are unchanged
+            written_files = [
+                path for path, stat in self._prefix_file_stats().items()
+                if previous_files.get(path) != stat
+            ]
+            # Fill a temporary directory first so an entry only appears once complete
+            tmp_entry = tempfile.mkdtemp(dir=cache_dir)
+            for output_file in written_files:
+                suffix = os.path.basename(output_file)[len(db_name):]
+                shutil.copy2(output_file, os.path.join(tmp_entry, "db" + suffix))
+            try:
+                os.rename(tmp_entry, entry)
+            except OSError:
+                # Another run cached the same database in the meantime
+                shutil.rmtree(tmp_entry)
+        
+        return mmseqs_output
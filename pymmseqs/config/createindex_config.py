@@ -1,13 +1,13 @@
 # pymmseqs/config/createindex_config.py
 
 from pathlib import Path
-from typing import Union
+from typing import Union, Optional
 
 from pymmseqs.config.base import BaseConfig
 from pymmseqs.defaults import loader
 from pymmseqs.utils import (
     get_caller_dir,
-    run_mmseqs_command
+    get_available_cpus
 )
 
 DEFAULTS = loader.load("createindex")
@@ -60,7 +60,7 @@ class CreateIndexConfig(BaseConfig):
         # Common parameters
         max_seq_len: int = 65535,
         v: int = 3,
-        threads: int = 14,
+        threads: Optional[int] = None,
         compressed: bool = False,
         remove_tmp_files: bool = False,
 
@@ -264,7 +264,7 @@ class CreateIndexConfig(BaseConfig):
 
         `threads` : int, optional
             CPU threads
-            - 14 (default)
+            - All CPUs available to the process (default)
 
         `compressed` : bool, optional
             Compress output
@@ -356,7 +356,7 @@ class CreateIndexConfig(BaseConfig):
         # Common parameters
         self.max_seq_len = max_seq_len
         self.v = v
-        self.threads = threads
+        self.threads = get_available_cpus() if threads is None else threads
         self.compressed = compressed
         self.remove_tmp_files = remove_tmp_files
 
@@ -382,10 +382,10 @@ class CreateIndexConfig(BaseConfig):
     def run(self) -> None:
         self._resolve_all_path(self._caller_dir)
 
-        self._validate()
+        self._validate_if_dirty()
 
         args = self._get_command_args("createindex")
-        mmseqs_output = run_mmseqs_command(args)
+        mmseqs_output = self._run_command(args)
 
         self._handle_command_output(
             mmseqs_output=mmseqs_output,
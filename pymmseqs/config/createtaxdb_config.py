@@ -1,13 +1,13 @@
 # pymmseqs/config/createtaxdb_config.py
 
 from pathlib import Path
-from typing import Union
+from typing import Union, Optional
 
 from .base import BaseConfig
 from ..defaults import loader
 from ..utils import (
     get_caller_dir,
-    run_mmseqs_command
+    get_available_cpus
 )
 
 DEFAULTS = loader.load("createtaxdb")
@@ -51,7 +51,7 @@ class CreateTaxDBConfig(BaseConfig):
 
     threads : int, optional
         Number of CPU cores to use
-        - Default: 14
+        - Default: all CPUs available to the process
 
     v : int, optional
         Verbosity level of the output
@@ -69,7 +69,7 @@ class CreateTaxDBConfig(BaseConfig):
         tax_mapping_file: Union[str, Path] = "",
         tax_mapping_mode: int = 0,
         tax_db_mode: int = 1,
-        threads: int = 14,
+        threads: Optional[int] = None,
         v: int = 3
     ):
         super().__init__()
@@ -80,7 +80,7 @@ class CreateTaxDBConfig(BaseConfig):
         self.tax_mapping_file = Path(tax_mapping_file) if tax_mapping_file else ""
         self.tax_mapping_mode = tax_mapping_mode
         self.tax_db_mode = tax_db_mode
-        self.threads = threads
+        self.threads = get_available_cpus() if threads is None else threads
         self.v = v
 
         self._defaults = DEFAULTS
@@ -110,7 +110,7 @@ class CreateTaxDBConfig(BaseConfig):
         self.validate()
         
         args = self._get_command_args("createtaxdb")
-        mmseqs_output = run_mmseqs_command(args)
+        mmseqs_output = self._run_command(args)
         
         self._handle_command_output(
             mmseqs_output=mmseqs_output,
@@ -1,13 +1,13 @@
 # pymmseqs/config/easy_cluster_config.py
 
 from pathlib import Path
-from typing import Union, List
+from typing import Union, List, Optional
 
 from pymmseqs.config.base import BaseConfig
 from pymmseqs.defaults import loader
 from pymmseqs.utils import (
     get_caller_dir,
-    run_mmseqs_command
+    get_available_cpus
 )
 
 DEFAULTS = loader.load("easy_cluster")
@@ -102,7 +102,7 @@ class EasyClusterConfig(BaseConfig):
         sub_mat: str = "aa:blosum62.out,nucl:nucleotide.out",
         max_seq_len: int = 65535,
         db_load_mode: int = 0,
-        threads: int = 14,
+        threads: Optional[int] = None,
         compressed: bool = False,
         v: int = 3,
         remove_tmp_files: bool = True,
@@ -501,7 +501,7 @@ class EasyClusterConfig(BaseConfig):
 
         `threads` : int, optional
             CPU threads
-            - 14 (default)
+            - All CPUs available to the process (default)
 
         `compressed` : bool, optional
             Compress output
@@ -648,7 +648,7 @@ class EasyClusterConfig(BaseConfig):
         self.sub_mat = sub_mat
         self.max_seq_len = max_seq_len
         self.db_load_mode = db_load_mode
-        self.threads = threads
+        self.threads = get_available_cpus() if threads is None else threads
         self.compressed = compressed
         self.v = v
         self.remove_tmp_files = remove_tmp_files
@@ -681,10 +681,10 @@ class EasyClusterConfig(BaseConfig):
     def run(self) -> None:
         self._resolve_all_path(self._caller_dir)
 
-        self._validate()
+        self._validate_if_dirty()
 
         args = self._get_command_args("easy-cluster")
-        mmseqs_output = run_mmseqs_command(args)
+        mmseqs_output = self._run_command(args)
 
         self._handle_command_output(
             mmseqs_output=mmseqs_output,
@@ -1,11 +1,11 @@
 from pathlib import Path
-from typing import Union, List
+from typing import Union, List, Optional
 
 from pymmseqs.config.base import BaseConfig
 from pymmseqs.defaults import loader
 from pymmseqs.utils import (
     get_caller_dir,
-    run_mmseqs_command
+    get_available_cpus
 )
 
 DEFAULTS = loader.load("easy_linclust")
@@ -82,7 +82,7 @@ class EasyLinClustConfig(BaseConfig):
         id_offset: int = 0,
 
         # Common parameters
-        threads: int = 14,
+        threads: Optional[int] = None,
         compressed: bool = False,
         v: int = 3,
         sub_mat: str = "aa:blosum62.out,nucl:nucleotide.out",
@@ -394,7 +394,7 @@ class EasyLinClustConfig(BaseConfig):
         -----------------
         `threads` : int, optional
             CPU threads
-            - 14 (default)
+            - All CPUs available to the process (default)
         
         `compressed` : bool, optional
             Compress output
@@ -539,7 +539,7 @@ class EasyLinClustConfig(BaseConfig):
         self.id_offset = id_offset
 
         # Initialize common parameters
-        self.threads = threads
+        self.threads = get_available_cpus() if threads is None else threads
         self.compressed = compressed
         self.v = v
         self.sub_mat = sub_mat
@@ -598,10 +598,10 @@ class EasyLinClustConfig(BaseConfig):
     def run(self) -> None:
         self._resolve_all_path(self._caller_dir)
 
-        self._validate()
+        self._validate_if_dirty()
 
         args = self._get_command_args("easy-linclust")
-        mmseqs_output = run_mmseqs_command(args)
+        mmseqs_output = self._run_command(args)
 
         self._handle_command_output(
             mmseqs_output=mmseqs_output,
@@ -1,11 +1,11 @@
 from pathlib import Path
-from typing import Union
+from typing import Union, Optional
 
 from pymmseqs.config.base import BaseConfig
 from pymmseqs.defaults import loader
 from pymmseqs.utils import (
     get_caller_dir,
-    run_mmseqs_command
+    get_available_cpus
 )
 
 DEFAULTS = loader.load("search")
@@ -117,7 +117,7 @@ class SearchConfig(BaseConfig):
         sub_mat: str = "aa:blosum62.out,nucl:nucleotide.out",
         max_seq_len: int = 65535,
         db_load_mode: int = 0,
-        threads: int = 14,
+        threads: Optional[int] = None,
         compressed: bool = False,
         v: int = 3,
         gpu: bool = False,
@@ -647,7 +647,7 @@ class SearchConfig(BaseConfig):
 
         `threads` : int, optional
             CPU threads
-            - 14 (default)
+            - All CPUs available to the process (default)
 
         `compressed` : bool, optional
             Compress output
@@ -886,7 +886,7 @@ class SearchConfig(BaseConfig):
         self.sub_mat = sub_mat
         self.max_seq_len = max_seq_len
         self.db_load_mode = db_load_mode
-        self.threads = threads
+        self.threads = get_available_cpus() if threads is None else threads
         self.compressed = compressed
         self.v = v
         self.gpu = gpu
@@ -929,10 +929,10 @@ class SearchConfig(BaseConfig):
     def run(self) -> None:
         self._resolve_all_path(self._caller_dir)
 
-        self._validate()
+        self._validate_if_dirty()
 
         args = self._get_command_args("search")
-        mmseqs_output = run_mmseqs_command(args)
+        mmseqs_output = self._run_command(args)
 
         self._handle_command_output(
             mmseqs_output=mmseqs_output,
@@ -1,7 +1,12 @@
 from pathlib import Path
+import sys
 import yaml
 from typing import Dict
 
+# The libyaml based loader parses the defaults several times faster, every config
+# module loads its defaults at import time
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 class DefaultsLoader:
     """Loader for YAML default configurations."""
     
@@ -24,9 +29,13 @@ class DefaultsLoader:
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
             
         with open(file_path) as f:
-            config = yaml.safe_load(f)
-            self._cache[name] = config
-            return config
+            config = yaml.load(f, Loader=_YamlLoader)
+            
+        # Parameter names are used for getattr lookups on every command build,
+        # interning them makes those lookups identity comparisons
+        config = {sys.intern(param): info for param, info in config.items()}
+        self._cache[name] = config
+        return config
 
 # Create a singleton instance
 loader = DefaultsLoader()
\ No newline at end of file
@@ -6,6 +6,8 @@ class CreateDBParser:
     """
     A class for parsing the output of the CreateDBConfig.
     """
+    __slots__ = ("sequence_db",)
+
     def __init__(self, config: CreateDBConfig):
         self.sequence_db = config.sequence_db
     
@@ -6,6 +6,8 @@ class CreateIndexParser:
     """
     A class for parsing the output of the CreateIndexConfig.
     """
+    __slots__ = ("sequence_db",)
+
     def __init__(self, config: CreateIndexConfig):
         self.sequence_db = config.sequence_db
     
@@ -3,7 +3,6 @@
 import os
 import pandas as pd
 from typing import Generator, Union
-from sklearn.model_selection import train_test_split
 
 from ..tools.easy_cluster_tools import parse_fasta_clusters
 from ..config import EasyClusterConfig
@@ -13,6 +12,8 @@ class EasyClusterParser:
     """
     A class for parsing the output of the EasyClusterConfig.
     """
+    __slots__ = ("cluster_prefix", "seq_id_separator", "seq_id_index")
+
     def __init__(
         self,
         config: EasyClusterConfig,
@@ -150,6 +151,9 @@ class EasyClusterParser:
         
         if val == 0 and test == 0:
             return rep_seqs, [], []
+
+        # scikit-learn is only needed for splitting, so importing pymmseqs does not require it
+        from sklearn.model_selection import train_test_split
         
         train_rep_seqs, temp_rep_seqs = train_test_split(
             rep_seqs,
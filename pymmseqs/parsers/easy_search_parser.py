@@ -11,6 +11,8 @@ class EasySearchParser:
     """
     A class for parsing the output of the EasySearchConfig.
     """
+    __slots__ = ("alignment_file",)
+
     def __init__(self, config: EasySearchConfig):
         if not config.format_mode == 4:
             raise ValueError(f"Using EasySearchParser with format_mode={config.format_mode} is not supported. Please use format_mode=4.")
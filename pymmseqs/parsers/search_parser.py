@@ -13,6 +13,8 @@ class SearchParser:
     """
     A class for parsing the output of the SearchConfig.
     """
+    __slots__ = ("query_db", "target_db", "alignment_db", "_readable")
+
     def __init__(self, config: SearchConfig):
         self.query_db = config.query_db
         self.target_db = config.target_db
@@ -4,10 +4,12 @@ from .utils import (
     get_caller_dir,
     resolve_path,
     add_arg,
+    get_available_cpus,
+    file_sha256,
     tmp_dir_handler,
     write_fasta
 )
-from .binary import get_mmseqs_binary
+from .binary import get_mmseqs_binary, refresh_binary
 from .runner import run_mmseqs_command
 from .tools_utils import has_header, to_superscript
 
@@ -15,7 +17,10 @@ __all__ = [
     "get_caller_dir",
     "resolve_path",
     "add_arg",
+    "get_available_cpus",
+    "file_sha256",
     "get_mmseqs_binary",
+    "refresh_binary",
     "run_mmseqs_command",
     "has_header",
     "to_superscript",
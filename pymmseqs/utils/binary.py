@@ -1,12 +1,17 @@
 # pymmseqs/utils/binary.py
 import os
 import platform
+from functools import lru_cache
 from sysconfig import get_path
 
+@lru_cache(maxsize=1)
 def get_mmseqs_binary():
     """
     Retrieve the path to the mmseqs2 binary.
     Allows overriding via the MMSEQS2_PATH environment variable.
+
+    The resolved path is cached after the first successful lookup. Call
+    `refresh_binary()` after changing MMSEQS2_PATH or reinstalling the binary.
     """
     custom_path = os.getenv('MMSEQS2_PATH')
     if custom_path:
@@ -27,3 +32,9 @@ def get_mmseqs_binary():
         )
     
     return binary_path
+
+def refresh_binary():
+    """
+    Drop the cached mmseqs2 binary path so the next lookup resolves it again.
+    """
+    get_mmseqs_binary.cache_clear()
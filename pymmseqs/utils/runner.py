@@ -1,19 +1,67 @@
 # pymmseqs/utils/runner.py
 
+import os
 import subprocess
+from contextlib import ExitStack
+from pathlib import Path
+from typing import IO, Dict, Union, Optional
+
 from .binary import get_mmseqs_binary
 
-def run_mmseqs_command(args, capture_output=True):
+def _open_stream(
+    target: Union[str, Path, IO, None],
+    stack: ExitStack
+) -> Optional[IO]:
+    """
+    Open `target` for writing if it is a path, otherwise return it unchanged.
+    """
+    if isinstance(target, (str, Path)):
+        return stack.enter_context(open(target, 'w'))
+    return target
+
+def run_mmseqs_command(
+    args,
+    capture_output=True,
+    stdout: Union[str, Path, IO, None] = None,
+    stderr: Union[str, Path, IO, None] = None,
+    env: Optional[Dict[str, str]] = None
+):
     """
     Run an mmseqs2 command with the given arguments.
     Raises RuntimeError if the command fails.
     Returns the command's result.
+
+    `stdout` and `stderr` can be a file path or an open file object. The
+    corresponding output is then written there while the command runs instead of
+    being kept in memory, and the matching attribute of the result is None.
+    Streams that are not redirected are still captured if `capture_output` is True.
+    Configs pass the targets set with `BaseConfig.stream_output()`.
+
+    `env` holds extra environment variables for mmseqs2, added on top of the current
+    environment. Without it, the child simply inherits the current environment.
     """
     binary = get_mmseqs_binary()
     cmd = [binary] + args
 
+    if env is not None:
+        env = {**os.environ, **env}
+
     print("\n" + "\033[34m" + "-"*20 + "\033[0m" + " Running a mmseqs2 command " + "\033[34m" + "-"*20 + "\033[0m")
 
-    result = subprocess.run(cmd, capture_output=capture_output, text=True)
-    
+    if stdout is None and stderr is None:
+        return subprocess.run(cmd, capture_output=capture_output, text=True, env=env)
+
+    default_stream = subprocess.PIPE if capture_output else None
+    with ExitStack() as stack:
+        stdout_stream = _open_stream(stdout, stack)
+        stderr_stream = _open_stream(stderr, stack)
+
+        result = subprocess.run(
+            cmd,
+            stdout=default_stream if stdout_stream is None else stdout_stream,
+            stderr=default_stream if stderr_stream is None else stderr_stream,
+            text=True,
+            env=env
+        )
+
     return result
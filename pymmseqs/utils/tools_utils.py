@@ -1,5 +1,4 @@
 # pymmseqs/utils/tools_utils.py
-import pandas as pd
 from csv import Sniffer
 
 def to_superscript(exp):
@@ -11,6 +10,9 @@ def has_header(file_path):
     """
     Determines if a CSV or TSV file has a header row.
     """
+    # pandas is only needed here, importing it lazily keeps `import pymmseqs` fast
+    import pandas as pd
+
     try:
         with open(file_path, 'r', newline='') as file:
             sample = file.read(1024)
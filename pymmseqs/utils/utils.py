@@ -1,15 +1,12 @@
 # pymmseqs/utils/utils.py
 
-import os
-import inspect
-from pathlib import Path
-from typing import Any, Tuple, List, Union
-
 import os
 import sys
+import hashlib
 import inspect
+from functools import lru_cache
 from pathlib import Path
-from IPython import get_ipython
+from typing import Any, List, Union
 
 def get_caller_dir() -> Path:
     """
@@ -23,15 +20,14 @@ def get_caller_dir() -> Path:
     Returns:
         Path: Absolute path to the directory containing the calling script
     """
-    # Check if running in a Jupyter notebook
-    try:
-        shell = get_ipython().__class__.__name__
+    # Check if running in a Jupyter notebook. A notebook kernel has always imported
+    # IPython already, so there is no need to import it (slowly) here
+    ipython = sys.modules.get('IPython')
+    if ipython is not None:
+        shell = ipython.get_ipython().__class__.__name__
         if shell == 'ZMQInteractiveShell':
             # Jupyter notebook detected; return current working directory
             return Path(os.getcwd())
-    except NameError:
-        # Not in an IPython environment; proceed with stack traversal
-        pass
     
     # Get the full call stack
     frame = inspect.currentframe()
@@ -64,7 +60,8 @@ def get_caller_dir() -> Path:
 
 def resolve_path(
     path: Path,
-    caller_dir: Path
+    caller_dir: Path,
+    create_parent: bool = True
 ) -> Path:
     """Resolves a path relative to `caller_dir` if not absolute and ensures its parent directory exists.
 
@@ -74,11 +71,15 @@ def resolve_path(
         Input path (relative or absolute).
     caller_dir : Path
         Base directory for resolving relative paths.
+    create_parent : bool, optional
+        Whether to create the parent directory. Inputs that must already exist do
+        not need it.
 
     Returns
     -------
     Path
-        Resolved absolute path. Parent directory is created if it doesn't exist.
+        Resolved absolute path. Parent directory is created if it doesn't exist
+        and `create_parent` is True.
     """
     path = Path(path)
     # Resolve relative path if not absolute
@@ -89,10 +90,42 @@ def resolve_path(
     path = path.resolve()
 
     # Optionally create the parent directory
-    os.makedirs(path.parent, exist_ok=True)
+    if create_parent:
+        os.makedirs(path.parent, exist_ok=True)
 
     return path
 
+def get_available_cpus() -> int:
+    """
+    Number of CPUs the current process is allowed to run on.
+
+    Uses the CPU affinity mask where the platform provides it, so CPU sets applied by
+    containers or schedulers are respected, and falls back to the total CPU count.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+@lru_cache(maxsize=1024)
+def _file_sha256(path: str, mtime_ns: int, size: int) -> str:
+    # mtime_ns and size are only part of the cache key, older versions of a file are
+    # evicted once the cache is full
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """
+    SHA-256 hex digest of a file's content.
+
+    Digests are cached per path, modification time and size, so unchanged files are
+    only read once per process.
+    """
+    stat = os.stat(path)
+    return _file_sha256(str(path), stat.st_mtime_ns, stat.st_size)
+
 def add_arg(
     args: List,
     flag: str,
@@ -101,9 +134,9 @@ def add_arg(
 ):
     if value != default:
         if isinstance(value, bool):
-            args.extend([flag, "1" if value else "0"])
+            args.extend((flag, "1" if value else "0"))
         else:
-            args.extend([flag, str(value)])
+            args.extend((flag, str(value)))
 
 def tmp_dir_handler(
     tmp_dir: Union[str, Path, None],
@@ -0,0 +1,57 @@
+import subprocess
+from pathlib import Path
+
+from pymmseqs.config import BaseConfig
+
+# Two sequence FASTA written as bytes, which skips the text encoding layer
+FASTA_BYTES = b">seq1\nAAAA\n>seq2\nCCCC\n"
+
+# Input for tests that never read it, it is only reported as existing through
+# BaseConfig._path_exists by the fake_fasta_file fixture
+FAKE_FASTA_FILE = Path("/fake/input_test.fasta")
+
+def fake_runner(calls, returncode=0, stderr=""):
+    """
+    Return a stand-in for BaseConfig._runner that records its arguments in `calls`.
+    """
+    def run(args):
+        calls.append(args)
+        return subprocess.CompletedProcess(args=args, returncode=returncode, stdout="output", stderr=stderr)
+    return run
+
+def fake_createdb_runner(calls):
+    """
+    Return a runner that writes the database files mmseqs2 createdb would create.
+    """
+    def run(args):
+        calls.append(args)
+        options = [i for i, arg in enumerate(args) if arg.startswith("-")]
+        sequence_db = args[(options[0] if options else len(args)) - 1]
+        suffixes = ["", ".index", ".dbtype", "_h", "_h.index", "_h.dbtype", ".source"]
+        if "--write-lookup" not in args:
+            suffixes.append(".lookup")
+        for suffix in suffixes:
+            Path(sequence_db + suffix).write_bytes(b"")
+        return subprocess.CompletedProcess(args=args, returncode=0, stdout="output", stderr="")
+    return run
+
+class RecordingConfig(BaseConfig):
+    """
+    Config that only records whether it ran, optionally failing.
+    """
+    __test__ = False
+
+    def __init__(self, fail=False, threads=None):
+        super().__init__()
+        self.fail = fail
+        self.ran = False
+        if threads is not None:
+            self.threads = threads
+
+    def _validate(self):
+        pass
+
+    def run(self):
+        self.ran = True
+        if self.fail:
+            raise RuntimeError("mmseqs2 failed")
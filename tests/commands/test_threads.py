@@ -0,0 +1,36 @@
+import pytest
+
+from pymmseqs import commands
+from pymmseqs.config import BaseConfig
+from pymmseqs.config import createindex_config, search_config
+from tests._fixtures.mocks import fake_runner
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    # Every config run records its arguments instead of starting mmseqs2
+    calls = []
+    monkeypatch.setattr(BaseConfig, "_runner", staticmethod(fake_runner(calls)))
+    for module in (search_config, createindex_config):
+        monkeypatch.setattr(module, "get_available_cpus", lambda: 3)
+    return calls
+
+def _threads(args):
+    return args[args.index("--threads") + 1]
+
+def test_search_uses_available_cpus_by_default(tmp_path, calls):
+    for name in ("query_db", "target_db"):
+        (tmp_path / name).touch()
+
+    commands.search(
+        query_db=tmp_path / "query_db",
+        target_db=tmp_path / "target_db",
+        alignment_db=tmp_path / "aln_db"
+    )
+    assert _threads(calls[0]) == "3"
+
+def test_createindex_uses_available_cpus_by_default(tmp_path, calls):
+    (tmp_path / "seq_db").touch()
+
+    commands.createindex(sequence_db=tmp_path / "seq_db")
+    assert _threads(calls[0]) == "3"
@@ -0,0 +1,22 @@
+import pytest
+
+from pymmseqs.config import BaseConfig
+from tests._fixtures.mocks import FAKE_FASTA_FILE, FASTA_BYTES
+
+
+@pytest.fixture
+def fake_fasta_file(monkeypatch):
+    # The input is only reported as existing, no file is written
+    path_exists = BaseConfig._path_exists
+    monkeypatch.setattr(
+        BaseConfig, "_path_exists",
+        staticmethod(lambda path: path == str(FAKE_FASTA_FILE) or path_exists(path))
+    )
+    return FAKE_FASTA_FILE
+
+@pytest.fixture
+def own_fasta_file(tmp_path):
+    # For tests that delete or replace their input
+    fasta_file = tmp_path / "input_test.fasta"
+    fasta_file.write_bytes(FASTA_BYTES)
+    return fasta_file
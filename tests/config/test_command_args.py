@@ -0,0 +1,60 @@
+import copy
+
+import pytest
+
+from pymmseqs.config import CreateDBConfig
+from tests._fixtures.mocks import FAKE_FASTA_FILE
+
+
+@pytest.fixture(scope="module")
+def createdb_template():
+    # Building a config loads its defaults and inspects the call stack, so it is done
+    # once per module. A shallow copy is enough since parameters are only reassigned,
+    # and it keeps sharing the loaded defaults
+    return CreateDBConfig(
+        fasta_file=[FAKE_FASTA_FILE, FAKE_FASTA_FILE],
+        sequence_db=FAKE_FASTA_FILE.parent / "mydb"
+    )
+
+@pytest.mark.parametrize("options, expected_args", [
+    # Options left at their YAML default are not passed to mmseqs
+    ({}, []),
+    # Booleans are passed as 1/0 and single character flags use one dash
+    ({"shuffle": False, "dbtype": 1, "v": 1}, ["--dbtype", "1", "--shuffle", "0", "-v", "1"]),
+    ({"compressed": True, "id_offset": 5}, ["--id-offset", "5", "--compressed", "1"]),
+    ({"createdb_mode": 1, "write_lookup": False}, ["--createdb-mode", "1", "--write-lookup", "0"]),
+], ids=["defaults", "bool_and_short_flag", "int_options", "createdb_mode"])
+def test_command_args(createdb_template, options, expected_args):
+    config = copy.copy(createdb_template)
+    config.set_parameters(**options)
+    assert config._get_command_args("createdb") == [
+        "createdb", str(FAKE_FASTA_FILE), str(FAKE_FASTA_FILE), str(FAKE_FASTA_FILE.parent / "mydb"),
+        *expected_args
+    ]
+
+def test_set_parameters(createdb_template):
+    """
+    Test that several parameters are updated at once and unknown names are rejected
+    """
+    config = copy.copy(createdb_template)
+    config.set_parameters(dbtype=2, v=1)
+    assert (config.dbtype, config.v) == (2, 1)
+    assert (createdb_template.dbtype, createdb_template.v) == (0, 3)
+
+    with pytest.raises(ValueError):
+        config.set_parameters(min_seq_id=0.5)
+
+def test_copies_do_not_recompile_class_defaults(createdb_template):
+    """
+    Test that deep copies build the same arguments without replacing the class's compiled defaults
+    """
+    expected_args = createdb_template._get_command_args("createdb")
+    class_compiled = CreateDBConfig._compiled
+
+    for _ in range(3):
+        config = copy.deepcopy(createdb_template)
+        assert config._get_command_args("createdb") == expected_args
+        assert config._compiled.defaults is config._defaults
+
+    assert CreateDBConfig._compiled is class_compiled
+    assert class_compiled.defaults is createdb_template._defaults
@@ -0,0 +1,175 @@
+import os
+import subprocess
+
+import pytest
+
+from pymmseqs.config import BaseConfig, CreateDBConfig
+from pymmseqs.config import base, createdb_config
+from tests._fixtures.mocks import RecordingConfig, fake_createdb_runner, fake_runner
+
+
+def test_run_executes_command_args(tmp_path, fake_fasta_file):
+    """
+    Test that run() passes the built arguments to the runner and logs the result
+    """
+    calls = []
+    config = CreateDBConfig(
+        fasta_file=fake_fasta_file,
+        sequence_db=tmp_path / "mydb"
+    )
+    config._runner = fake_runner(calls)
+    config.run()
+
+    assert calls == [["createdb", str(fake_fasta_file), str(tmp_path / "mydb")]]
+    assert len(list((tmp_path / "logs").glob("mydb_*.log"))) == 1
+
+def test_run_failure_raises(tmp_path, fake_fasta_file):
+    """
+    Test that a non-zero return code is reported with the mmseqs2 error message
+    """
+    config = CreateDBConfig(
+        fasta_file=fake_fasta_file,
+        sequence_db=tmp_path / "mydb"
+    )
+    config._runner = fake_runner([], returncode=1, stderr="Error: invalid input")
+
+    with pytest.raises(RuntimeError, match="invalid input"):
+        config.run()
+
+def _streaming_runner(calls, returncode=0):
+    def run(args, stdout=None, stderr=None):
+        calls.append((args, stdout, stderr))
+        return subprocess.CompletedProcess(args=args, returncode=returncode, stdout=None, stderr=None)
+    return run
+
+def test_run_streams_output(tmp_path, fake_fasta_file):
+    """
+    Test that streams set with stream_output() reach the runner and are named in the log
+    """
+    calls = []
+    config = CreateDBConfig(
+        fasta_file=fake_fasta_file,
+        sequence_db=tmp_path / "mydb"
+    )
+    config._runner = _streaming_runner(calls)
+    config.stream_output(stdout=tmp_path / "mmseqs.out")
+    config.run()
+
+    assert [(stdout, stderr) for _, stdout, stderr in calls] == [(tmp_path / "mmseqs.out", None)]
+    (log_file,) = (tmp_path / "logs").glob("mydb_*.log")
+    assert f"STDOUT: written to {tmp_path / 'mmseqs.out'}" in log_file.read_text()
+
+def test_run_failure_names_streamed_stderr(tmp_path, fake_fasta_file):
+    """
+    Test that a failure points to the file holding the streamed error output
+    """
+    config = CreateDBConfig(
+        fasta_file=fake_fasta_file,
+        sequence_db=tmp_path / "mydb"
+    )
+    config._runner = _streaming_runner([], returncode=1)
+    config.stream_output(stderr=tmp_path / "mmseqs.err")
+
+    with pytest.raises(RuntimeError, match="mmseqs.err"):
+        config.run()
+
+def test_automatic_createdb_mode_follows_option_changes(tmp_path, own_fasta_file):
+    """
+    Test that the automatic createdb mode is chosen again on every run
+    """
+    calls = []
+    config = CreateDBConfig(
+        fasta_file=own_fasta_file,
+        sequence_db=tmp_path / "mydb"
+    )
+    config._runner = fake_runner(calls)
+    config.run()
+
+    config.shuffle = False
+    config.run()
+
+    assert "--createdb-mode" not in calls[0]
+    assert calls[1][-4:] == ["--shuffle", "0", "--createdb-mode", "1"]
+    assert config.createdb_mode is None
+
+def test_automatic_createdb_mode_reads_inputs_once_per_run(monkeypatch, tmp_path, own_fasta_file):
+    """
+    Test that validation and the command arguments share one automatic mode choice
+    """
+    scans = []
+    is_single_line_fasta = createdb_config._is_single_line_fasta
+
+    def counting_is_single_line_fasta(fasta_file):
+        scans.append(fasta_file)
+        return is_single_line_fasta(fasta_file)
+
+    monkeypatch.setattr(createdb_config, "_is_single_line_fasta", counting_is_single_line_fasta)
+    config = CreateDBConfig(
+        fasta_file=own_fasta_file,
+        sequence_db=tmp_path / "mydb",
+        shuffle=False
+    )
+    config._runner = fake_runner([])
+
+    config.run()
+    assert len(scans) == 1
+    config.run()
+    assert len(scans) == 2
+
+def test_cache_only_keeps_files_of_its_own_run(tmp_path, own_fasta_file):
+    """
+    Test that leftovers of an earlier run are neither cached nor kept on a cache hit
+    """
+    calls = []
+    cache_dir = tmp_path / "cache"
+
+    def createdb(output, **options):
+        config = CreateDBConfig(fasta_file=own_fasta_file, sequence_db=output, **options)
+        config._runner = fake_createdb_runner(calls)
+        config.run()
+
+    # The first run leaves a .lookup file that the cached run does not write
+    createdb(tmp_path / "first" / "mydb")
+    createdb(tmp_path / "first" / "mydb", write_lookup=False, cache_dir=cache_dir)
+    (entry,) = [p for p in cache_dir.iterdir() if p.is_dir()]
+    assert "db.lookup" not in os.listdir(entry)
+
+    createdb(tmp_path / "second" / "mydb")
+    createdb(tmp_path / "second" / "mydb", write_lookup=False, cache_dir=cache_dir)
+    assert len(calls) == 3
+    assert not (tmp_path / "second" / "mydb.lookup").exists()
+    assert (tmp_path / "second" / "mydb.index").exists()
+
+def test_run_many_runs_all_configs_before_raising():
+    """
+    Test that a failing config does not prevent the others from running
+    """
+    configs = [RecordingConfig(fail=(i == 0)) for i in range(4)]
+
+    with pytest.raises(RuntimeError):
+        BaseConfig.run_many(configs, max_parallel=2)
+
+    assert all(config.ran for config in configs)
+
+@pytest.mark.parametrize("threads, expected_parallel", [
+    ([None, None], 4),
+    ([4, 4], 1),
+    ([1, 2], 2),
+    ([8, 1], 1),
+], ids=["no_threads", "all_cpus", "smaller_threads", "more_than_cpus"])
+def test_run_many_default_parallelism(monkeypatch, threads, expected_parallel):
+    """
+    Test that by default no more runs start at once than fit on the available CPUs
+    """
+    pool_sizes = []
+    thread_pool = base.ThreadPoolExecutor
+
+    def recording_pool(max_workers):
+        pool_sizes.append(max_workers)
+        return thread_pool(max_workers=max_workers)
+
+    monkeypatch.setattr(base, "get_available_cpus", lambda: 4)
+    monkeypatch.setattr(base, "ThreadPoolExecutor", recording_pool)
+
+    BaseConfig.run_many([RecordingConfig(threads=t) for t in threads])
+    assert pool_sizes == [expected_parallel]
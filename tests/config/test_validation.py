@@ -0,0 +1,132 @@
+import pytest
+
+from pymmseqs.config import CreateDBConfig
+from tests._fixtures.mocks import FASTA_BYTES
+
+
+def test_deleted_input_is_reported(tmp_path, own_fasta_file):
+    """
+    Test that an input removed after a first check is reported by a new config
+    """
+    def check():
+        CreateDBConfig(
+            fasta_file=own_fasta_file,
+            sequence_db=tmp_path / "mydb"
+        )._check_required_files()
+
+    check()
+    own_fasta_file.unlink()
+    with pytest.raises(FileNotFoundError):
+        check()
+
+def test_many_files_in_one_directory(tmp_path):
+    """
+    Test that listing a directory still reports the one missing input file
+    """
+    fasta_files = [tmp_path / f"shard_{i}.fasta" for i in range(6)]
+    for fasta_file in fasta_files[:-1]:
+        fasta_file.write_bytes(b">seq1\nAAAA\n")
+
+    config = CreateDBConfig(
+        fasta_file=fasta_files,
+        sequence_db=tmp_path / "mydb"
+    )
+    with pytest.raises(FileNotFoundError):
+        config._check_required_files()
+
+    fasta_files[-1].write_bytes(b">seq1\nAAAA\n")
+    config._check_required_files()
+
+def test_validation_is_skipped_until_a_parameter_changes(monkeypatch, tmp_path, own_fasta_file):
+    """
+    Test that a validated config is only validated again after an assignment
+    """
+    config = CreateDBConfig(
+        fasta_file=own_fasta_file,
+        sequence_db=tmp_path / "mydb"
+    )
+    validations = []
+    validate = config._validate
+
+    def counting_validate(**kwargs):
+        validations.append(kwargs)
+        validate(**kwargs)
+
+    monkeypatch.setattr(config, "_validate", counting_validate)
+
+    config._validate_if_dirty()
+    assert len(validations) == 1
+
+    # A removed input is not noticed while nothing changed
+    own_fasta_file.unlink()
+    config._validate_if_dirty()
+    config.id_offset = 0
+    config._validate_if_dirty()
+    assert len(validations) == 1
+
+    config.id_offset = 5
+    with pytest.raises(FileNotFoundError):
+        config._validate_if_dirty()
+    assert len(validations) == 2
+
+@pytest.mark.parametrize("fasta_content, options, expected_mode", [
+    (FASTA_BYTES, {"shuffle": False}, 1),
+    # mmseqs2 can only soft-link single-line FASTA
+    (b">seq1\nAA\nAA\n>seq2\nCCCC\n", {"shuffle": False}, 0),
+    # Soft-linking cannot be combined with shuffling or compression
+    (FASTA_BYTES, {}, 0),
+    (FASTA_BYTES, {"shuffle": False, "compressed": True}, 0),
+], ids=["soft_link", "multi_line_fasta", "shuffled", "compressed"])
+def test_createdb_mode_resolution(tmp_path, fasta_content, options, expected_mode):
+    fasta_file = tmp_path / "input_test.fasta"
+    fasta_file.write_bytes(fasta_content)
+    config = CreateDBConfig(
+        fasta_file=fasta_file,
+        sequence_db=tmp_path / "mydb",
+        **options
+    )
+    config._resolve_all_path(tmp_path)
+    assert config._resolve_createdb_mode() == expected_mode
+
+@pytest.mark.parametrize("input_name, options, expected_error", [
+    ("input_test.fasta", {}, None),
+    ("input_test.fasta", {"dbtype": 3}, ValueError),
+    ("input_test.fasta", {"createdb_mode": 2}, ValueError),
+    ("input_test.fasta", {"id_offset": -1}, ValueError),
+    ("missing.fasta", {}, FileNotFoundError),
+], ids=["valid", "bad_dbtype", "bad_createdb_mode", "negative_id_offset", "missing_input"])
+def test_validate(tmp_path, own_fasta_file, input_name, options, expected_error):
+    config = CreateDBConfig(
+        fasta_file=own_fasta_file.parent / input_name,
+        sequence_db=tmp_path / "mydb",
+        **options
+    )
+    if expected_error is None:
+        config._validate()
+    else:
+        with pytest.raises(expected_error):
+            config._validate()
+
+def test_resolving_inputs_creates_no_directories(tmp_path):
+    """
+    Test that only output paths get their parent directory created
+    """
+    config = CreateDBConfig(
+        fasta_file="missing_dir/input_test.fasta",
+        sequence_db="out/mydb"
+    )
+    config._resolve_all_path(tmp_path)
+
+    assert (tmp_path / "out").is_dir()
+    assert not (tmp_path / "missing_dir").exists()
+    with pytest.raises(FileNotFoundError):
+        config._validate()
+
+def test_unhashable_choice_value_is_rejected(tmp_path, fake_fasta_file):
+    config = CreateDBConfig(
+        fasta_file=fake_fasta_file,
+        sequence_db=tmp_path / "mydb",
+        dbtype=[1]
+    )
+    with pytest.raises(ValueError):
+        config._validate_choices()
@@ -7,77 +7,108 @@ from pymmseqs.config import CreateDBConfig
 
 
 class TestCreateDB(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The input FASTA is only read, so it is created once for all tests.
+        # Each test writes its outputs into its own subdirectory
+        cls._tmp_dir = tempfile.TemporaryDirectory()
+        cls.tmp_path = Path(cls._tmp_dir.name)
+
+        # Create test FASTA file
+        cls.fasta_file = cls.tmp_path / "input_test.fasta"
+        cls.fasta_file.write_bytes(b">seq1\nAAAA\n>seq2\nCCCC\n")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp_dir.cleanup()
+
     def test_createdb_output_matches_cli(self):
         """
         Test that our createdb function produces identical output to mmseqs CLI
         """
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            
-            # Create test FASTA file
-            fasta_content = ">seq1\nAAAA\n>seq2\nCCCC\n"
-            fasta_file = tmp_path / "input_test.fasta"
-            fasta_file.write_text(fasta_content)
-            
-            # Define output paths
-            func_output = tmp_path / "func_output" / "mydb"
-            cli_output = tmp_path / "cli_output" / "mydb"
-            
-            # 1. Run our Python function implementation
-            config = CreateDBConfig(
-                fasta_file=fasta_file,
-                sequence_db=func_output,
-                write_lookup=1  # Match CLI default behavior
-            )
-            config.run()
-            
-            # 2. Run mmseqs CLI command
-            # Create parent directory for CLI output
-            cli_output.parent.mkdir(parents=True, exist_ok=True)
-            
-            subprocess.run(
-                [
-                    "mmseqs",
-                    "createdb",
-                    str(fasta_file),
-                    str(cli_output),
-                    "--write-lookup", "1"  # Match our function's default
-                ],
-                check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            
-            # 3. Compare outputs
-            # Get all generated files from both implementations
-            func_files = set(func_output.parent.glob("mydb*"))
-            cli_files = set(cli_output.parent.glob("mydb*"))
-            
-            # Check same number of files created
-            self.assertEqual(
-                len(func_files),
-                len(cli_files),
-                "Different number of output files generated"
+        # Define output paths
+        func_output = self.tmp_path / "func_output" / "mydb"
+        cli_output = self.tmp_path / "cli_output" / "mydb"
+
+        # 1. Run our Python function implementation
+        config = CreateDBConfig(
+            fasta_file=self.fasta_file,
+            sequence_db=func_output,
+            write_lookup=1  # Match CLI default behavior
+        )
+        config.run()
+
+        # 2. Run mmseqs CLI command
+        # Create parent directory for CLI output
+        cli_output.parent.mkdir(parents=True, exist_ok=True)
+
+        subprocess.run(
+            [
+                "mmseqs",
+                "createdb",
+                str(self.fasta_file),
+                str(cli_output),
+                "--write-lookup", "1"  # Match our function's default
+            ],
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+
+        # 3. Compare outputs
+        # Get all generated files from both implementations
+        func_files = set(func_output.parent.glob("mydb*"))
+        cli_files = set(cli_output.parent.glob("mydb*"))
+
+        # Check same number of files created
+        self.assertEqual(
+            len(func_files),
+            len(cli_files),
+            "Different number of output files generated"
+        )
+
+        # Compare each pair of files
+        for func_file in func_files:
+            filename = func_file.name
+            cli_file = cli_output.parent / filename
+
+            # Verify file exists in CLI output
+            self.assertTrue(
+                cli_file.exists(),
+                f"File {filename} missing in CLI output"
             )
-            
-            # Compare each pair of files
-            for func_file in func_files:
-                filename = func_file.name
-                cli_file = cli_output.parent / filename
-                
-                # Verify file exists in CLI output
-                self.assertTrue(
-                    cli_file.exists(),
-                    f"File {filename} missing in CLI output"
+
+            # Compare file contents
+            with open(func_file, "rb") as f1, open(cli_file, "rb") as f2:
+                self.assertEqual(
+                    f1.read(),
+                    f2.read(),
+                    f"Content mismatch in {filename}"
                 )
-                
-                # Compare file contents
-                with open(func_file, "rb") as f1, open(cli_file, "rb") as f2:
-                    self.assertEqual(
-                        f1.read(),
-                        f2.read(),
-                        f"Content mismatch in {filename}"
-                    )
+
+    def test_createdb_cache_reuses_database(self):
+        """
+        Test that a cached database is restored with the same content as the original run
+        """
+        cache_dir = self.tmp_path / "cache"
+
+        first_output = self.tmp_path / "first" / "mydb"
+        second_output = self.tmp_path / "second" / "mydb"
+        for output in (first_output, second_output):
+            CreateDBConfig(
+                fasta_file=self.fasta_file,
+                sequence_db=output,
+                cache_dir=cache_dir
+            ).run()
+
+        # Only the first run adds an entry to the cache
+        self.assertEqual(len([p for p in cache_dir.iterdir() if p.is_dir()]), 1)
+
+        # Both runs must produce the same file names with the same content
+        self.assertEqual(
+            {p.name: p.read_bytes() for p in first_output.parent.glob("mydb*")},
+            {p.name: p.read_bytes() for p in second_output.parent.glob("mydb*")}
+        )
 
 if __name__ == "__main__":
     unittest.main()
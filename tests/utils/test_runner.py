@@ -0,0 +1,94 @@
+import subprocess
+
+import pytest
+
+from pymmseqs.utils import runner
+
+
+def _recording_run(calls):
+    def run(cmd, **kwargs):
+        calls.append((cmd, kwargs))
+        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="output", stderr="")
+    return run
+
+def test_binary_is_prepended(monkeypatch):
+    """
+    Test that the mmseqs2 binary is run with the given arguments and inherits the environment
+    """
+    calls = []
+    monkeypatch.setattr(runner, "get_mmseqs_binary", lambda: "/usr/bin/mmseqs")
+    monkeypatch.setattr(runner.subprocess, "run", _recording_run(calls))
+
+    result = runner.run_mmseqs_command(["createdb", "in.fasta", "db"])
+
+    assert result.stdout == "output"
+    assert len(calls) == 1
+    cmd, kwargs = calls[0]
+    assert cmd == ["/usr/bin/mmseqs", "createdb", "in.fasta", "db"]
+    assert kwargs["env"] is None
+
+def test_env_is_added_to_the_current_environment(monkeypatch):
+    """
+    Test that extra environment variables are merged on top of os.environ
+    """
+    calls = []
+    monkeypatch.setattr(runner, "get_mmseqs_binary", lambda: "/usr/bin/mmseqs")
+    monkeypatch.setattr(runner.subprocess, "run", _recording_run(calls))
+    monkeypatch.setenv("PYMMSEQS_TEST_VAR", "inherited")
+
+    runner.run_mmseqs_command(["version"], env={"OMP_NUM_THREADS": "2"})
+
+    env = calls[0][1]["env"]
+    assert env["OMP_NUM_THREADS"] == "2"
+    assert env["PYMMSEQS_TEST_VAR"] == "inherited"
+
+@pytest.fixture
+def calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(runner, "get_mmseqs_binary", lambda: "/usr/bin/mmseqs")
+    monkeypatch.setattr(runner.subprocess, "run", _recording_run(calls))
+    return calls
+
+def test_stream_to_path(tmp_path, calls):
+    """
+    Test that a path target is opened for the command and closed afterwards
+    """
+    log_file = tmp_path / "mmseqs.log"
+    runner.run_mmseqs_command(["version"], stdout=log_file, stderr=str(log_file) + ".err")
+
+    kwargs = calls[0][1]
+    assert kwargs["stdout"].name == str(log_file)
+    assert kwargs["stderr"].name == str(log_file) + ".err"
+    assert kwargs["stdout"].closed and kwargs["stderr"].closed
+    assert log_file.exists()
+
+def test_stream_to_file_object(tmp_path, calls):
+    """
+    Test that an open file object is passed through and left open
+    """
+    with open(tmp_path / "mmseqs.log", "w") as log:
+        runner.run_mmseqs_command(["version"], stdout=log, stderr=log)
+        assert not log.closed
+
+    kwargs = calls[0][1]
+    assert kwargs["stdout"] is log
+    assert kwargs["stderr"] is log
+
+@pytest.mark.parametrize("capture_output, expected_stderr", [
+    (True, subprocess.PIPE),
+    (False, None),
+], ids=["captured", "inherited"])
+def test_stream_one_of_two(tmp_path, calls, capture_output, expected_stderr):
+    """
+    Test that the stream that is not redirected follows `capture_output`
+    """
+    runner.run_mmseqs_command(
+        ["version"],
+        capture_output=capture_output,
+        stdout=tmp_path / "mmseqs.log"
+    )
+
+    kwargs = calls[0][1]
+    assert kwargs["stdout"].name == str(tmp_path / "mmseqs.log")
+    assert kwargs["stderr"] is expected_stderr
+